@@ -33,10 +33,12 @@ class ServiceXMLRPC(object):
     def __getattr__(self, method):
         def rpc_method(*args):
             try:
-                self._sock = xmlrpclib_custom.TimeoutServerProxy(
+                # Local to the call: concurrent requests (e.g. the
+                # 'Model.iter' prefetch thread) must not share a proxy
+                sock = xmlrpclib_custom.TimeoutServerProxy(
                     self._url, allow_none=True,
                     timeout=self._connector.timeout)
-                sock_method = getattr(self._sock, method, False)
+                sock_method = getattr(sock, method, False)
                 return sock_method(*args)
             #NOTE: exception raised with these kind of requests:
             #   - execute('fake.model', 'search', [])
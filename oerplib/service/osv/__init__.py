@@ -19,7 +19,7 @@
 #
 ##############################################################################
 
-from oerplib.service.osv.browse import BrowseRecord
+from oerplib.service.osv.browse import BrowseRecord, RecordSet
 from oerplib.service.osv.osv import Model
 
 # vim:expandtab:smartindent:tabstop=4:softtabstop=4:shiftwidth=4:
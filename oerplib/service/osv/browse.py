@@ -62,6 +62,12 @@ class BrowseRecord(object):
          'name': 'res.users'}
 
     """
+    # Records are instanciated in large quantities, restrict them to the
+    # two attributes they really need ('__oerp__' and '__osv__' are
+    # class-level attributes). Field values are stored in the '__data__'
+    # dictionary, read through the field descriptors of the class.
+    __slots__ = ['_id', '__data__']
+
     __oerp__ = None
     __osv__ = None
 
@@ -103,13 +109,84 @@ class BrowseRecord(object):
                 (other.__osv__['name'], other.id)
 
 
+class RecordSet(object):
+    """.. versionadded:: 0.9
+
+    Set of records fetched with a single `read` RPC request.
+    The raw data is kept in columnar form: one list of values per field,
+    shared by all the records of the set, instead of one dictionary per
+    record. ``browse_record`` instances are only built when a record is
+    accessed (by index or iteration), which keeps the memory footprint of
+    large sets low as long as individual records are not materialized.
+
+    >>> partners = oerp.get('res.partner').browse_list([1, 2, 3])
+    >>> len(partners)
+    3
+    >>> partners[0].name
+    u'Your Company'
+    >>> partners.column('name')     # Raw values, no record built
+    [u'Your Company', u'ASUStek', u'Agrolait']
+
+    """
+    __slots__ = ['model', 'ids', 'context', 'fields', '_columns']
+
+    def __init__(self, model, ids, raw_data, context=None, fields=None):
+        self.model = model
+        self.ids = ids
+        self.context = context
+        self.fields = fields
+        # Pivot the rows (one dictionary per record) into columns (one list
+        # of values per field)
+        field_names = ids and list(raw_data[ids[0]]) or []
+        self._columns = dict(
+            (field_name, [raw_data[id_].get(field_name, False)
+                          for id_ in ids])
+            for field_name in field_names)
+
+    def __repr__(self):
+        # Only data already fetched is displayed, no RPC request involved
+        return "record_set(%r, %r)" % (self.model._name, self.ids)
+
+    def column(self, field_name):
+        """Return the list of raw values of the field `field_name` for all
+        records of the set, without building any ``browse_record``.
+
+        """
+        return self._columns[field_name][:]
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, index):
+        # Slicing returns a sub-'RecordSet' sharing no list with this one,
+        # like slicing a list of records would
+        if isinstance(index, slice):
+            subset = RecordSet.__new__(RecordSet)
+            subset.model = self.model
+            subset.ids = self.ids[index]
+            subset.context = self.context
+            subset.fields = self.fields
+            subset._columns = dict(
+                (field_name, values[index])
+                for field_name, values in self._columns.items())
+            return subset
+        row = dict((field_name, values[index])
+                   for field_name, values in self._columns.items())
+        return self.model._browse_from_raw(
+            self.ids[index], row, context=self.context, fields=self.fields)
+
+    def __iter__(self):
+        for index in range(len(self.ids)):
+            yield self[index]
+
+
 class BrowseRecordIterator(object):
     """Iterator of browsable records.
     In fact, it is a generator to return records one by one, and able to
     increment/decrement records by overriding '+=' and '-=' operators.
     """
     def __init__(self, model, ids, context=None,
-                 parent=None, parent_field=None):
+                 parent=None, parent_field=None, fields=None):
         self.model = model
         self.ids = ids
         self.context = context
@@ -118,10 +195,17 @@ class BrowseRecordIterator(object):
             self.index = 0
         self.parent = parent
         self.parent_field = parent_field
+        self.fields = fields
+        self.raw_data = None
 
     def __len__(self):
         return len(self.ids)
 
+    def __repr__(self):
+        # Only data already fetched is displayed, no RPC request involved
+        return "browse_record_iterator(%r, %r)" % (
+            self.model._name, self.ids)
+
     def __iter__(self):
         return self
 
@@ -129,9 +213,18 @@ class BrowseRecordIterator(object):
         if self.index is None or self.index >= len(self.ids):
             raise StopIteration
         else:
+            # Fetch the data of all records with a single 'read' RPC request
+            # instead of one request per record
+            if self.raw_data is None:
+                self.raw_data = self.model._read_raw_data(
+                    self.ids, context=self.context, fields=self.fields)
             id_ = self.ids[self.index]
             self.index += 1
-            return self.model.browse(id_, context=self.context)
+            return self.model._browse_from_raw(
+                id_, self.raw_data[id_], context=self.context,
+                fields=self.fields)
+
+    __next__ = next     # Python 3
 
     def __iadd__(self, records):
         if not self.parent or not self.parent_field:
@@ -23,10 +23,14 @@ A field is a Python descriptor which defines getter/setter methods for
 its related attribute.
 """
 import datetime
+import sys
 
 from oerplib import error
 from oerplib.service.osv import browse
 
+if sys.version_info >= (3,):
+    basestring = str
+
 
 def is_int(value):
     """Return `True` if ``value`` is an integer."""
@@ -142,7 +146,14 @@ class SelectionField(BaseField):
     def __get__(self, instance, owner):
         if self.name in instance.__data__['updated_values']:
             return instance.__data__['updated_values'][self.name]
-        return instance.__data__['values'][self.name]
+        value = instance.__data__['values'][self.name]
+        # None value => get the value on the fly
+        if value is None:
+            value = instance.__oerp__.read(
+                instance.__osv__['name'],
+                [instance.id], [self.name])[0][self.name]
+            instance.__data__['values'][self.name] = value
+        return value
 
     def __set__(self, instance, value):
         value = self.check_value(value)
@@ -412,6 +423,12 @@ class DateField(BaseField):
         value = instance.__data__['values'][self.name]
         if self.name in instance.__data__['updated_values']:
             value = instance.__data__['updated_values'][self.name]
+        # None value => get the value on the fly
+        elif value is None:
+            value = instance.__oerp__.read(
+                instance.__osv__['name'],
+                [instance.id], [self.name])[0][self.name]
+            instance.__data__['values'][self.name] = value
         try:
             res = datetime.datetime.strptime(value, self.pattern).date()
         except Exception:  # ValueError, TypeError
@@ -452,6 +469,12 @@ class DateTimeField(BaseField):
         value = instance.__data__['values'][self.name]
         if self.name in instance.__data__['updated_values']:
             value = instance.__data__['updated_values'][self.name]
+        # None value => get the value on the fly
+        elif value is None:
+            value = instance.__oerp__.read(
+                instance.__osv__['name'],
+                [instance.id], [self.name])[0][self.name]
+            instance.__data__['values'][self.name] = value
         try:
             res = datetime.datetime.strptime(value, self.pattern)
         except Exception:  # ValueError, TypeError
@@ -496,7 +519,14 @@ class ValueField(BaseField):
     def __get__(self, instance, owner):
         if self.name in instance.__data__['updated_values']:
             return instance.__data__['updated_values'][self.name]
-        return instance.__data__['values'][self.name]
+        value = instance.__data__['values'][self.name]
+        # None value => get the value on the fly
+        if value is None:
+            value = instance.__oerp__.read(
+                instance.__osv__['name'],
+                [instance.id], [self.name])[0][self.name]
+            instance.__data__['values'][self.name] = value
+        return value
 
     def __set__(self, instance, value):
         value = self.check_value(value)
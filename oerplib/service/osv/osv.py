@@ -22,12 +22,133 @@
 methods proposed by a data model."""
 
 import sys  # to check Python version at runtime
-import collections
+import copy
+import threading
+import weakref
 
 from oerplib.tools import v
 from oerplib import error
 from oerplib.service.osv import fields, browse
 
+# Cache of the 'fields_get' data, shared by all Model instances.
+# Fields metadata are static per server, so there is no need to fetch
+# them again for each instanciation of a same model (e.g. each call to
+# 'OERP.get', 'OERP.write_record'...). Keyed by (OERP instance ID,
+# database, model name, user language).
+_FIELDS_GET_CACHE = {}
+
+# Cache of the generated browse classes, with the same database-aware
+# key as '_FIELDS_GET_CACHE'. Values are weak references: a class is
+# dropped from the cache (and regenerated on demand) as soon as no
+# model or record uses it anymore.
+_BROWSE_CLASS_CACHE = weakref.WeakValueDictionary()
+
+# Weak references to the 'OERP' instances having entries in the caches
+# above, keyed by instance ID. Their callback drops these entries when
+# the instance is garbage collected: without it, '_FIELDS_GET_CACHE'
+# would keep data of dead sessions forever, and a new instance reusing
+# the same 'id()' could be served the data of the old one.
+_CACHE_CLEANERS = {}
+
+
+def _register_cache_cleaner(oerp):
+    """Watch `oerp` to purge its cache entries once it is dead."""
+    oerp_id = id(oerp)
+    if oerp_id in _CACHE_CLEANERS:
+        return
+
+    def clean(ref):
+        del _CACHE_CLEANERS[oerp_id]
+        for key in list(_FIELDS_GET_CACHE):
+            if key[0] == oerp_id:
+                del _FIELDS_GET_CACHE[key]
+        for key in list(_BROWSE_CLASS_CACHE):
+            if key[0] == oerp_id:
+                _BROWSE_CLASS_CACHE.pop(key, None)
+
+    _CACHE_CLEANERS[oerp_id] = weakref.ref(oerp, clean)
+
+
+# Sentinel distinguishing "field absent from the raw data" from any
+# legitimate field value (False, None...) in the generated '_reset'
+_MISSING = object()
+
+
+def _generate_reset_impl(cls_fields):
+    """Generate a specialized '_reset' function for a browse class.
+    The field set is frozen when the class is generated, which lets us
+    unroll the "copy raw data to values" loop into straight-line code
+    instead of iterating columns dynamically on each record refresh.
+    The 'raw_data.get' bound method is looked up once and each field
+    costs a single dictionary lookup (instead of a membership test
+    followed by an indexing).
+
+    Return `None` if the function could not be generated (e.g. `exec`
+    is disabled), in which case the interpreted fallback of
+    :func:`Model._reset` is used.
+
+    """
+    src = [
+        "def _reset_impl(obj):",
+        "    obj_data = obj.__data__",
+        "    obj_data['updated_values'] = {}",
+        "    values = obj_data['values']",
+        "    get_raw = obj_data['raw_data'].get",
+    ]
+    for field_name in cls_fields:
+        src.append("    value = get_raw({0!r}, _missing)".format(field_name))
+        src.append(
+            "    if value is not _missing: values[{0!r}] = value"
+            .format(field_name))
+    namespace = {'_missing': _MISSING}
+    try:
+        exec("\n".join(src), namespace)
+    except Exception:
+        return None
+    return namespace['_reset_impl']
+
+
+def _generate_build_vals_impl(cls_fields):
+    """Generate a specialized function building the `vals` dictionary sent
+    by :func:`Model._write_record`. The field types are known when the
+    browse class is generated, so the Many2One unwrapping is decided here
+    instead of with an `isinstance` check per field on every write.
+
+    Return `None` if the function could not be generated (e.g. `exec`
+    is disabled), in which case the interpreted fallback of
+    :func:`Model._write_record` is used.
+
+    """
+    src = [
+        "def _build_vals_impl(obj):",
+        "    obj_data = obj.__data__",
+        "    updated_values = obj_data['updated_values']",
+        "    raw_data = obj_data['raw_data']",
+        "    vals = {}",
+    ]
+    for field_name, field in cls_fields.items():
+        src.append(
+            "    if {0!r} in updated_values and {0!r} in raw_data:"
+            .format(field_name))
+        # Many2One fields
+        if isinstance(field, fields.Many2OneField):
+            src.append(
+                "        value = updated_values[{0!r}]".format(field_name))
+            src.append(
+                "        vals[{0!r}] = value and value[0]".format(field_name))
+        # All other fields
+        else:
+            src.append(
+                "        vals[{0!r}] = updated_values[{0!r}]"
+                .format(field_name))
+    src.append("    return vals")
+    namespace = {}
+    try:
+        exec("\n".join(src), namespace)
+    except Exception:
+        return None
+    return namespace['_build_vals_impl']
+
 
 class Model(object):
     """.. versionadded:: 0.5
@@ -62,9 +183,11 @@ class Model(object):
         super(Model, self).__init__()
         self._oerp = oerp
         self._name = model
+        self._rpc_methods = {}
+        self._default_get_cache = {}
         self._browse_class = self._generate_browse_class()
 
-    def browse(self, ids, context=None):
+    def browse(self, ids, context=None, fields=None):
         """Browse one or several records (if `ids` is a list of IDs)
         from `model`. The fields and values for such objects are generated
         dynamically.
@@ -75,6 +198,16 @@ class Model(object):
         >>> [partner.name for partner in oerp.get('res.partner').browse([1, 2])]
         [u'Your Company', u'ASUStek']
 
+        .. versionadded:: 0.9
+
+        With `fields`, only the listed fields are fetched from the server,
+        which saves bandwidth and server CPU on models carrying big
+        `text`/`binary` columns. Unlisted fields remain accessible, their
+        value is fetched on the fly when accessed (one extra `read` RPC
+        request per field):
+
+        >>> partner = oerp.get('res.partner').browse(1, fields=['name'])
+
         A list of data types used by ``browse_record`` fields are
         available :ref:`here <fields>`.
 
@@ -84,31 +217,91 @@ class Model(object):
 
         """
         if isinstance(ids, list):
-            return browse.BrowseRecordIterator(self, ids, context=context)
-            #return browse.BrowseRecordIterator(
-            #    model=self,
-            #    ids=ids,
-            #    context=context)
+            return browse.BrowseRecordIterator(
+                self, ids, context=context, fields=fields)
         else:
             obj = self._browse_class(ids)
-            self._refresh(obj, context)
+            self._refresh(obj, context, fields=fields)
             return obj
-            #return self.browse(ids, context)
+
+    def browse_list(self, ids, context=None, fields=None):
+        """.. versionadded:: 0.9
+
+        Same as :func:`browse` with a list of IDs, but return a
+        :class:`RecordSet <oerplib.service.osv.RecordSet>` built from a
+        single `read` RPC request. The record set behaves like a list of
+        ``browse_record`` (length, indexing, iteration) but stores the
+        fetched data in columnar form, one list of values per field shared
+        by all its records, which is noticeably lighter when browsing
+        thousands of records.
+
+        >>> [partner.name for partner in oerp.get('res.partner').browse_list([1, 2])]
+        [u'Your Company', u'ASUStek']
+
+        With `fields`, only the listed fields are fetched (see
+        :func:`browse`).
+
+        :return: a :class:`RecordSet <oerplib.service.osv.RecordSet>`
+            instance
+        :raise: :class:`oerplib.error.RPCError`
+
+        """
+        raw_data = self._read_raw_data(ids, context=context, fields=fields)
+        return browse.RecordSet(
+            self, ids, raw_data, context=context, fields=fields)
+
+    @staticmethod
+    def invalidate_fields_cache(model=None):
+        """Drop the cached `fields_get` data and generated browse classes,
+        for the model named `model` only, or for all models if no name is
+        supplied. Useful if fields were added/removed on the server
+        (e.g. after a module installation).
+
+        >>> oerplib.service.osv.Model.invalidate_fields_cache('res.partner')
+
+        """
+        for key in list(_FIELDS_GET_CACHE):
+            if model is None or key[2] == model:
+                del _FIELDS_GET_CACHE[key]
+        for key in list(_BROWSE_CLASS_CACHE):
+            if model is None or key[2] == model:
+                _BROWSE_CLASS_CACHE.pop(key, None)
 
     def _generate_browse_class(self):
         """Generate a class with all its fields corresponding to
         the model name supplied and return them.
 
         """
+        user_context = getattr(self._oerp, '_context', None) or {}
+        # The database is part of the key: the same 'OERP' instance can be
+        # logged in again on another database, where fields may differ
+        cache_key = (id(self._oerp), self._oerp.database, self._name,
+                     user_context.get('lang'))
+        _register_cache_cleaner(self._oerp)
+        # Reuse the class generated by a previous Model instanciation, if
+        # still alive
+        cached_cls = _BROWSE_CLASS_CACHE.get(cache_key)
+        if cached_cls is not None:
+            return cached_cls
         # Retrieve server fields info and generate corresponding local fields
-        fields_get = self._oerp.execute(self._name, 'fields_get')
+        # (the 'fields_get' result is cached to avoid one RPC request per
+        # model instanciation)
+        if cache_key not in _FIELDS_GET_CACHE:
+            _FIELDS_GET_CACHE[cache_key] = self._oerp.execute(
+                self._name, 'fields_get')
+        fields_get = _FIELDS_GET_CACHE[cache_key]
         cls_name = self._name.replace('.', '_')
         # Encode the class name for the Python2 'type()' function.
         # No need to do this for Python3.
-        if type(cls_name) == unicode and sys.version_info < (3,):
+        if sys.version_info < (3,) and isinstance(cls_name, unicode):
             cls_name = cls_name.encode('utf-8')
         cls_fields = {}
+        # Does the model have fields computed server-side? If not, a write
+        # does not need to be followed by a 'read' to get fresh values
+        has_computed = False
         for field_name, field_data in fields_get.items():
+            if 'function' in field_data or 'related' in field_data:
+                has_computed = True
             if field_name not in Model.fields_reserved:
                 cls_fields[field_name] = fields.generate_field(
                     self, field_name, field_data)
@@ -118,29 +311,63 @@ class Model(object):
             field_data = {'type': 'text', 'string': 'Name', 'readonly': True}
             cls_fields['name'] = fields.generate_field(self, 'name', field_data)
 
-        cls = type(cls_name, (browse.BrowseRecord,), {})
+        # Empty '__slots__': instances only use the storage defined by
+        # 'BrowseRecord.__slots__', no per-instance '__dict__' is created
+        cls = type(cls_name, (browse.BrowseRecord,), {'__slots__': ()})
         cls.__oerp__ = self._oerp
-        cls.__osv__ = {'name': self._name, 'columns': cls_fields}
-        slots = ['__oerp__', '__osv__', '__dict__', '__data__']
-        slots.extend(cls_fields.keys())
-        cls.__slots__ = slots
+        # Precompute the field name lists used on every record refresh,
+        # instead of scanning all the columns each time
+        basic_fields = []
+        relational_fields = []
+        for field_name, field in cls_fields.items():
+            if getattr(field, 'relation', False):
+                relational_fields.append(field_name)
+            else:
+                basic_fields.append(field_name)
+        cls.__osv__ = {'name': self._name, 'columns': cls_fields,
+                       'has_computed': has_computed,
+                       'basic_fields': basic_fields,
+                       'relational_fields': relational_fields}
+        # Install the field descriptors on the generated class once and for
+        # all, they are shared by all its instances
+        for field_name, field in cls_fields.items():
+            setattr(cls, field_name, field)
+        reset_impl = _generate_reset_impl(cls_fields)
+        if reset_impl is not None:
+            cls._reset_impl = staticmethod(reset_impl)
+        build_vals_impl = _generate_build_vals_impl(cls_fields)
+        if build_vals_impl is not None:
+            cls._build_vals_impl = staticmethod(build_vals_impl)
+        _BROWSE_CLASS_CACHE[cache_key] = cls
         return cls
 
-    def _write_record(self, obj, context=None):
-        """Send values of fields updated to the server."""
+    def _write_record(self, obj, context=None, refresh=None):
+        """Send values of fields updated to the server.
+        With `refresh` set to `False`, field values are updated locally from
+        the values sent instead of being fetched again from the server (by
+        default, the record is only fetched again if the model has fields
+        computed server-side).
+
+        """
         context = context or self._oerp.context
         obj_data = obj.__data__
-        vals = {}
-        for field_name in obj_data['updated_values']:
-            if field_name in obj_data['raw_data']:
-                field = self._browse_class.__osv__['columns'][field_name]
-                field_value = obj.__data__['updated_values'][field_name]
-                # Many2One fields
-                if isinstance(field, fields.Many2OneField):
-                    vals[field_name] = field_value and field_value[0]
-                # All other fields
-                else:
-                    vals[field_name] = field_value
+        # Specialized function generated with the browse class
+        build_vals_impl = getattr(obj.__class__, '_build_vals_impl', None)
+        if build_vals_impl is not None:
+            vals = build_vals_impl(obj)
+        # Interpreted fallback
+        else:
+            vals = {}
+            for field_name in obj_data['updated_values']:
+                if field_name in obj_data['raw_data']:
+                    field = self._browse_class.__osv__['columns'][field_name]
+                    field_value = obj.__data__['updated_values'][field_name]
+                    # Many2One fields
+                    if isinstance(field, fields.Many2OneField):
+                        vals[field_name] = field_value and field_value[0]
+                    # All other fields
+                    else:
+                        vals[field_name] = field_value
         try:
             if v(self._oerp.version) < v('6.1'):
                 res = self.write([obj.id], vals, context)
@@ -149,12 +376,155 @@ class Model(object):
         except error.Error as exc:
             raise exc
         else:
-            # Update raw_data dictionary
-            # FIXME: make it optional to avoid a RPC request?
-            self._refresh(obj, context)
+            # Update the raw_data dictionary. The extra 'read' RPC request
+            # is only worth it if the server may have recomputed values
+            if refresh is None:
+                refresh = self._browse_class.__osv__['has_computed']
+            if refresh:
+                self._refresh(obj, context)
+            else:
+                for field_name in obj_data['updated_values']:
+                    if field_name not in obj_data['raw_data']:
+                        continue
+                    field = self._browse_class.__osv__['columns'][field_name]
+                    if getattr(field, 'relation', False):
+                        # Fetched again on the fly at the next access
+                        obj_data['raw_data'][field_name] = None
+                    else:
+                        obj_data['raw_data'][field_name] = \
+                            obj_data['updated_values'][field_name]
+                self._reset(obj)
             return res
 
-    def _refresh(self, obj, context=None):
+    def iter(self, args=None, pagesize=200, prefetch=True, context=None):
+        """.. versionadded:: 0.9
+
+        Return a generator to iterate on records matching the `args` search
+        criteria (all records of the model by default). Records are fetched
+        by pages of `pagesize` records, with one `search` and one `read` RPC
+        request per page instead of one `read` per record. If `prefetch` is
+        set, the next page is fetched in a background thread while records
+        of the current one are consumed.
+
+        >>> for partner in oerp.get('res.partner').iter([('customer', '=', True)]):
+        ...     print(partner.name)
+
+        :return: a generator of ``browse_record`` instances
+        :raise: :class:`oerplib.error.RPCError`
+
+        """
+        if args is None:
+            args = []
+        context = context or self._oerp.context
+
+        def fetch(offset):
+            """Fetch the IDs and the raw data of one page of records."""
+            if v(self._oerp.version) < v('6.1'):
+                ids = self.search(args, offset, pagesize, None, context)
+            else:
+                ids = self.search(args, offset, pagesize, context=context)
+            raw_data = ids and self._read_raw_data(ids, context=context) or {}
+            return ids, raw_data
+
+        def fetch_in(offset, result):
+            """'fetch' wrapper for the prefetch thread. Exceptions are
+            stored in `result` to be re-raised in the main thread."""
+            try:
+                result.append(fetch(offset))
+            except Exception as exc:
+                result.append(exc)
+
+        page = fetch(0)
+        offset = pagesize
+        while page[0]:
+            ids, raw_data = page
+            thread = result = None
+            if prefetch and len(ids) == pagesize:
+                result = []
+                thread = threading.Thread(
+                    target=fetch_in, args=(offset, result))
+                thread.daemon = True
+                thread.start()
+            for id_ in ids:
+                yield self._browse_from_raw(
+                    id_, raw_data[id_], context=context)
+            if thread is not None:
+                thread.join()
+                page = result[0]
+                if isinstance(page, Exception):
+                    raise page
+            elif len(ids) == pagesize:
+                page = fetch(offset)
+            else:
+                break
+            offset += pagesize
+
+    def _read_raw_data(self, ids, context=None, fields=None):
+        """Fetch in a single `read` RPC request the raw data of the records
+        identified by `ids`, and return them as a dictionary mapping each ID
+        to its row of data. If `fields` is supplied, only the listed fields
+        are read (relational fields are always fetched on the fly when
+        accessed, listed or not).
+
+        :raise: :class:`oerplib.error.RPCError` (if a record does not exist)
+
+        """
+        context = context or self._oerp.context
+        # Get basic fields (no relational ones)
+        basic_fields = self._browse_class.__osv__['basic_fields']
+        if fields is not None:
+            basic_fields = [field_name for field_name in basic_fields
+                            if field_name in fields]
+        if v(self._oerp.version) < v('6.1'):
+            data = self.read(ids, basic_fields, context)
+        else:
+            data = self.read(ids, basic_fields, context=context)
+        raw_data = dict((row['id'], row) for row in data or [])
+        for id_ in ids:
+            if id_ not in raw_data:
+                raise error.RPCError(
+                    "There is no '{model}' record with ID {obj_id}.".format(
+                        model=self._browse_class.__osv__['name'], obj_id=id_))
+        return raw_data
+
+    def _browse_from_raw(self, o_id, raw_row, context=None, fields=None):
+        """Generate a browsable record from a row of data already fetched
+        from the server (no RPC request involved).
+
+        """
+        # Fast-path construction: with '__slots__' in place, allocating
+        # through '__new__' and assigning the two slots directly is cheaper
+        # than going through 'BrowseRecord.__init__'
+        cls = self._browse_class
+        obj = cls.__new__(cls)
+        obj._id = o_id
+        obj.__data__ = {'values': {}, 'raw_data': {}, 'updated_values': {}}
+        self._refresh_from_raw(obj, raw_row, context, fields=fields)
+        return obj
+
+    def _refresh_from_raw(self, obj, raw_data, context=None, fields=None):
+        """Restore field values of `obj` from a row of data already fetched
+        from the server (no RPC request involved). `fields` indicates that
+        a partial read was performed: fields left out are marked to be
+        fetched on the fly when accessed.
+
+        """
+        context = context or self._oerp.context
+        obj_data = obj.__data__
+        obj_data['context'] = context
+        # Relational fields are set to None to be fetched on the fly when
+        # accessed
+        for field_name in obj.__osv__['relational_fields']:
+            obj_data['raw_data'][field_name] = None
+        # Same for basic fields left out of a partial read
+        if fields is not None:
+            for field_name in obj.__osv__['basic_fields']:
+                if field_name not in raw_data:
+                    obj_data['raw_data'][field_name] = None
+        obj_data['raw_data'].update(raw_data)
+        self._reset(obj)
+
+    def _refresh(self, obj, context=None, fields=None):
         """Retrieve field values from the server.
         May be used to restore the original values
         in the purpose to cancel all changes made.
@@ -163,39 +533,36 @@ class Model(object):
         context = context or self._oerp.context
         obj_data = obj.__data__
         obj_data['context'] = context
-        # Get basic fields (no relational ones)
-        basic_fields = []
-        for field_name, field in obj.__osv__['columns'].iteritems():
-            if not getattr(field, 'relation', False):
-                basic_fields.append(field_name)
-            else:
-                obj_data['raw_data'][field_name] = None
         # Fill fields with values of the record
         if obj.id:
-            if v(self._oerp.version) < v('6.1'):
-                data = self.read([obj.id], basic_fields, context)
-                if data:
-                    obj_data['raw_data'].update(data[0])
-                else:
-                    obj_data['raw_data'] = False
-            else:
-                data = self.read([obj.id], basic_fields, context=context)
-                if data:
-                    obj_data['raw_data'].update(data[0])
-                else:
-                    obj_data['raw_data'] = False
-            if obj_data['raw_data'] is False:
-                raise error.RPCError(
-                    "There is no '{model}' record with ID {obj_id}.".format(
-                        model=obj.__class__.__osv__['name'], obj_id=obj.id))
+            raw_data = self._read_raw_data(
+                [obj.id], context=context, fields=fields)
+            self._refresh_from_raw(
+                obj, raw_data[obj.id], context, fields=fields)
+            return
         # No ID: fields filled with default values
         else:
-            if v(self._oerp.version) < v('6.1'):
-                default_get = self.default_get(
-                    obj.__osv__['columns'].keys(), context)
-            else:
-                default_get = self.default_get(
-                    obj.__osv__['columns'].keys(), context=context)
+            # Default values are cached per (columns, context): applications
+            # which build many blank records (forms, wizards...) only pay
+            # one 'default_get' RPC request per distinct context
+            try:
+                cache_key = (frozenset(obj.__osv__['columns']),
+                             tuple(sorted(context.items())))
+                default_get = self._default_get_cache.get(cache_key)
+            except TypeError:
+                # Unhashable context value, no caching possible
+                cache_key = default_get = None
+            if default_get is None:
+                if v(self._oerp.version) < v('6.1'):
+                    default_get = self.default_get(
+                        list(obj.__osv__['columns']), context)
+                else:
+                    default_get = self.default_get(
+                        list(obj.__osv__['columns']), context=context)
+                if cache_key is not None:
+                    self._default_get_cache[cache_key] = default_get
+            # Deep copy so local changes cannot corrupt the cached values
+            default_get = copy.deepcopy(default_get)
             obj_data['raw_data'] = {}
             for field_name in obj.__osv__['columns']:
                 obj_data['raw_data'][field_name] = False
@@ -208,14 +575,20 @@ class Model(object):
         last call to _refresh() method).
 
         """
+        # Specialized function generated with the browse class
+        reset_impl = getattr(obj.__class__, '_reset_impl', None)
+        if reset_impl is not None:
+            reset_impl(obj)
+            return
+        # Interpreted fallback
         obj_data = obj.__data__
         obj_data['updated_values'] = {}
-        # Load fields and their values
-        for field in self._browse_class.__osv__['columns'].values():
-            if field.name in obj_data['raw_data']:
-                obj_data['values'][field.name] = \
-                    obj_data['raw_data'][field.name]
-                setattr(obj.__class__, field.name, field)
+        # Load field values (the field descriptors themselves are installed
+        # on the class by '_generate_browse_class')
+        columns = self._browse_class.__osv__['columns']
+        for field_name, raw_value in obj_data['raw_data'].items():
+            if field_name in columns:
+                obj_data['values'][field_name] = raw_value
 
     def _unlink_record(self, obj, context=None):
         """Delete the object from the server."""
@@ -227,6 +600,13 @@ class Model(object):
 
     def __getattr__(self, method):
         """Provide a dynamic access to a RPC method."""
+        # Reuse the wrapper built on a previous access instead of creating
+        # a new closure on each RPC call. 'self.__dict__' is used directly
+        # to avoid a recursion if '_rpc_methods' is not set yet.
+        rpc_methods = self.__dict__.setdefault('_rpc_methods', {})
+        if method in rpc_methods:
+            return rpc_methods[method]
+
         def rpc_method(*args, **kwargs):
             """Return the result of the RPC request."""
             if v(self._oerp.version) < v('6.1'):
@@ -243,6 +623,9 @@ class Model(object):
                 result = self._oerp.execute_kw(
                     self._browse_class.__osv__['name'], method, args, kwargs)
             return result
+        # The wrapper checks the server version and the configuration at
+        # call time, so it can be cached regardless of them
+        rpc_methods[method] = rpc_method
         return rpc_method
 
     def __repr__(self):
@@ -255,11 +638,56 @@ class Model(object):
     def __getitem__(self, obj_id):
         return self.browse(obj_id)
 
+    def __contains__(self, obj_id):
+        """Check the existence of a record with a simple counting `search`
+        RPC request, without iterating (and fetching!) all the records of
+        the model as the default Python fallback on `__iter__` would do.
+
+        """
+        if isinstance(obj_id, browse.BrowseRecord):
+            obj_id = obj_id.id
+        return bool(self._oerp.search(
+            self._browse_class.__osv__['name'],
+            [('id', '=', obj_id)], count=True))
+
     def __iter__(self):
-        ids = self.search([])
-        return browse.BrowseRecordIterator(self, ids)
+        return self.iter()
 
     def __len__(self):
-        return self._oerp.search(self._browse_class.__osv__['name'], count=True)
+        # A counting 'search' request here would be triggered implicitly by
+        # innocuous expressions such as 'if model:' or 'list(model)'.
+        # TypeError (and not NotImplementedError) is swallowed by the
+        # length-hint protocol, so 'list(model)' and 'sorted(model)' fall
+        # back on the paginated '__iter__' while 'len(model)' fails loudly
+        raise TypeError(
+            "len() is not supported on a model, "
+            "use the 'count()' method instead.")
+
+    def __nonzero__(self):
+        # Without this, a truthiness test on a model would call '__len__'
+        return True
+
+    __bool__ = __nonzero__  # Python 3
+
+    def count(self, args=None, context=None):
+        """.. versionadded:: 0.9
+
+        Return the number of records matching the `args` search criteria
+        (all records of the model by default) with a single counting
+        `search` RPC request.
+
+        >>> oerp.get('res.partner').count([('customer', '=', True)])
+        7
+
+        :return: the number of records
+        :raise: :class:`oerplib.error.RPCError`
+
+        """
+        if args is None:
+            args = []
+        context = context or self._oerp.context
+        return self._oerp.search(
+            self._browse_class.__osv__['name'], args,
+            context=context, count=True)
 
 # vim:expandtab:smartindent:tabstop=4:softtabstop=4:shiftwidth=4:
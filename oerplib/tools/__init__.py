@@ -22,13 +22,17 @@
 manage the configuration related to an instance of :class:`OERP <oerplib.OERP>`,
 and some useful helper functions used internally in `OERPLib`.
 """
-import collections
 import re
 
+try:
+    from collections.abc import MutableMapping     # Python 3
+except ImportError:
+    from collections import MutableMapping         # Python 2
+
 MATCH_VERSION = re.compile(r'[^\d.]')
 
 
-class Config(collections.MutableMapping):
+class Config(MutableMapping):
     """Class which manage the configuration of an
     :class:`OERP <oerplib.OERP>` instance.
 
@@ -65,6 +69,25 @@ class Config(collections.MutableMapping):
     def __len__(self):
         return len(self._options)
 
+    # Delegate directly to the underlying dictionary instead of relying on
+    # the pure Python implementations of the 'MutableMapping' ABC (which
+    # call '__iter__'/'__getitem__' repeatedly)
+
+    def __contains__(self, key):
+        return key in self._options
+
+    def get(self, key, default=None):
+        return self._options.get(key, default)
+
+    def keys(self):
+        return self._options.keys()
+
+    def values(self):
+        return self._options.values()
+
+    def items(self):
+        return self._options.items()
+
     def __str__(self):
         return self._options.__str__()
 
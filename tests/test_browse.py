@@ -45,6 +45,19 @@ class TestBrowse(unittest.TestCase):
             self.assertIsInstance(
                 result, oerplib.service.osv.browse.BrowseRecord)
 
+    def test_browse_with_fields(self):
+        user_obj = self.oerp.get('res.users')
+        # Check the result returned
+        result = user_obj.browse(self.user.id, fields=['name'])
+        self.assertEqual(self.user, result)
+        self.assertEqual(self.user.name, result.name)
+        # Unlisted fields are fetched on the fly when accessed
+        self.assertEqual(self.user.login, result.login)
+        # With a list of IDs
+        for result in user_obj.browse([self.user.id], fields=['name']):
+            self.assertEqual(self.user, result)
+            self.assertEqual(self.user.login, result.login)
+
     def test_browse_with_id_false(self):
         # Check the result returned
         result = self.oerp.browse('res.users', False)
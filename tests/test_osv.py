@@ -43,12 +43,37 @@ class TestOSV(unittest.TestCase):
             model.search,
             False)  # Wrong arg
 
+    def test_model_contains(self):
+        # Check the result returned
+        model = self.oerp.get('res.users')
+        self.assertIn(self.user.id, model)
+        self.assertIn(self.user, model)
+        self.assertNotIn(999999999, model)
+
     def test_model_browse_with_one_id(self):
         # Check the result returned
         model = self.oerp.get('res.users')
         user = model.browse(self.user.id)
         self.assertEqual(user, self.user)
 
+    def test_model_browse_list(self):
+        # Check the result returned
+        model = self.oerp.get('res.users')
+        result = model.browse_list([self.user.id])
+        self.assertIsInstance(result, oerplib.service.osv.RecordSet)
+        self.assertEqual(len(result), 1)
+        self.assertEqual(self.user, result[0])
+        self.assertEqual([self.user], list(result))
+        self.assertIn(self.user.login, result.column('login'))
+        # Slicing
+        sub_result = result[0:1]
+        self.assertIsInstance(sub_result, oerplib.service.osv.RecordSet)
+        self.assertEqual([self.user], list(sub_result))
+        # With context
+        context = self.oerp.execute('res.users', 'context_get')
+        result = model.browse_list([self.user.id], context)
+        self.assertEqual([self.user], list(result))
+
     def test_model_browse_with_ids(self):
         # Iteration
         for result in self.oerp.get('res.users').browse([self.user.id]):